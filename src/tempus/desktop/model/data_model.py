@@ -1,11 +1,14 @@
 """Data model for handling large CSV time-series data."""
 
+from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
@@ -21,6 +24,24 @@ class DataModel(QObject):
     data_cleared = pyqtSignal()
     error_occurred = pyqtSignal(str)  # Emitted on errors, with error message
 
+    # Formats tried on time columns the CSV parser left as text. Dotted dates are
+    # day-first (German), which pandas' format guessing would read month-first.
+    DATETIME_FORMATS = (
+        "%d.%m.%Y %H:%M:%S",
+        "%d.%m.%Y %H:%M",
+        "%d.%m.%Y",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%d %H:%M",
+        "%Y-%m-%d",
+    )
+    # Subset of DATETIME_FORMATS without a time of day
+    DATE_FORMATS = ("%d.%m.%Y", "%Y-%m-%d")
+    # Formats of a separate time-of-day column (e.g. "Uhrzeit" next to "Datum")
+    TIME_OF_DAY_FORMATS = ("%H:%M:%S", "%H:%M")
+    # Names (lowercase) a separate time-of-day column must have
+    TIME_OF_DAY_NAMES = ("uhrzeit", "time")
+
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._dataframe: pd.DataFrame | None = None
@@ -141,6 +162,7 @@ class DataModel(QObject):
         # Identify numeric columns (exclude time/date columns)
         self._numeric_columns = []
         self._time_column = None
+        time_columns = []
 
         # Look for time/date columns
         for col in df.columns:
@@ -148,6 +170,7 @@ class DataModel(QObject):
             if any(term in col_lower for term in ["datum", "date", "time", "timestamp", "uhrzeit"]):
                 if self._time_column is None:
                     self._time_column = col
+                time_columns.append(col)
                 continue
 
             # Check if column is numeric (handle columns with missing values)
@@ -171,8 +194,14 @@ class DataModel(QObject):
         # Create time values array (use index if no time column found)
         if self._time_column is not None:
             try:
+                # Dates and times of day may be split across two columns
+                time_column = df[self._time_column]
+                time_of_day_column = self._find_time_of_day_column(df, time_columns)
+                if time_of_day_column is not None:
+                    time_column = self._combine_date_and_time(time_column, df[time_of_day_column])
+
                 # Try to parse as datetime
-                time_series = pd.to_datetime(df[self._time_column], errors="coerce")
+                time_series = self._parse_time_column(time_column)
                 if time_series.notna().any():
                     # Store datetime values for axis formatting
                     self._datetime_values = pd.DatetimeIndex(time_series)
@@ -180,16 +209,131 @@ class DataModel(QObject):
                     self._time_values = time_series.astype(np.int64).to_numpy() / 1e9  # Convert to Unix timestamp
                 else:
                     self._datetime_values = None
-                    self._time_values = np.arange(len(df))
+                    self._time_values = np.arange(len(df), dtype=np.float64)
             except Exception:
                 self._datetime_values = None
-                self._time_values = np.arange(len(df))
+                self._time_values = np.arange(len(df), dtype=np.float64)
         else:
             self._datetime_values = None
-            self._time_values = np.arange(len(df))
+            self._time_values = np.arange(len(df), dtype=np.float64)
 
         self.data_loaded.emit(filename)
 
+    def _parse_time_column(self, column: pd.Series) -> pd.Series:
+        """Parse a time column into datetime values.
+
+        Timestamps already parsed by the CSV reader are cast directly. Text is
+        parsed with Arrow's vectorized strptime, using a format detected once
+        from the first value. Unparseable values become NaT.
+
+        Args:
+            column: Time column as loaded from the CSV
+
+        Returns:
+            Series of datetime64[ns] values
+        """
+        # pyarrow parses ISO timestamps while reading; pd.to_datetime would walk
+        # such a column element by element, so just cast it
+        dtype = column.dtype
+        if (
+            isinstance(dtype, pd.ArrowDtype)
+            and pa.types.is_timestamp(dtype.pyarrow_dtype)
+            and dtype.pyarrow_dtype.tz is None
+        ):
+            return column.astype("datetime64[ns]")
+
+        fmt = self._detect_datetime_format(column)
+        if fmt is not None:
+            try:
+                parsed = pc.strptime(pa.array(column, from_pandas=True), format=fmt, unit="s", error_is_null=True)  # ty: ignore[unresolved-attribute]
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                parsed = None
+            if parsed is not None and parsed.null_count < len(parsed):
+                return pd.Series(parsed.to_numpy(zero_copy_only=False), index=column.index).astype("datetime64[ns]")
+
+        # Unknown format: let pandas infer it
+        return pd.to_datetime(column, errors="coerce")
+
+    def _find_time_of_day_column(self, df: pd.DataFrame, time_columns: list[str]) -> str | None:
+        """Find a column holding the time of day for a date-only time column.
+
+        Only columns named exactly like a time of day (see TIME_OF_DAY_NAMES)
+        qualify, so unrelated columns such as "Runtime" or "last_update" are
+        never joined to the dates.
+
+        Args:
+            df: Loaded dataframe
+            time_columns: Time/date columns in column order; the first one is the time column
+
+        Returns:
+            Name of the time-of-day column, or None if the first time column
+            already includes the time or no time-of-day column exists
+        """
+        if len(time_columns) < 2:
+            return None
+
+        date_column = df[time_columns[0]]
+        date_dtype = date_column.dtype
+        is_date = isinstance(date_dtype, pd.ArrowDtype) and pa.types.is_date(date_dtype.pyarrow_dtype)
+        if not is_date and self._detect_datetime_format(date_column) not in self.DATE_FORMATS:
+            return None
+
+        for col in time_columns[1:]:
+            if col.strip().lower() not in self.TIME_OF_DAY_NAMES:
+                continue
+            column = df[col]
+            if isinstance(column.dtype, pd.ArrowDtype) and pa.types.is_time(column.dtype.pyarrow_dtype):
+                return col
+            if self._detect_datetime_format(column, self.TIME_OF_DAY_FORMATS) is not None:
+                return col
+        return None
+
+    def _combine_date_and_time(self, date_column: pd.Series, time_column: pd.Series) -> pd.Series:
+        """Join date and time-of-day columns into one text column.
+
+        Uses Arrow's string kernels, so no per-row Python strings are created.
+        Rows missing either part become null.
+
+        Args:
+            date_column: Dates (text or Arrow dates)
+            time_column: Times of day (text or Arrow times)
+
+        Returns:
+            Series of "<date> <time>" strings
+        """
+        date_text = pc.cast(pa.array(date_column, from_pandas=True), pa.string())
+        time_text = pc.cast(pa.array(time_column, from_pandas=True), pa.string())
+        combined = pc.binary_join_element_wise(date_text, time_text, " ")  # ty: ignore[unresolved-attribute]
+        return pd.Series(pd.arrays.ArrowExtensionArray(combined), index=date_column.index, name=date_column.name)
+
+    def _detect_datetime_format(self, column: pd.Series, formats: tuple[str, ...] | None = None) -> str | None:
+        """Find the first format that matches the column's first value.
+
+        Args:
+            column: Time column as loaded from the CSV
+            formats: strptime formats to try, DATETIME_FORMATS if None
+
+        Returns:
+            Matching strptime format, or None if the column is not text or no format matches
+        """
+        if formats is None:
+            formats = self.DATETIME_FORMATS
+
+        first_index = column.first_valid_index()
+        if first_index is None:
+            return None
+        sample = column[first_index]
+        if not isinstance(sample, str):
+            return None
+
+        for fmt in formats:
+            try:
+                datetime.strptime(sample, fmt)
+            except ValueError:
+                continue
+            return fmt
+        return None
+
     def get_column_data(self, column: str) -> np.ndarray | None:
         """Get the data for a specific column as a numpy array.
 
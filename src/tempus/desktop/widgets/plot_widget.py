@@ -1,41 +1,135 @@
 """High-performance plot widget using pyqtgraph."""
 
-from datetime import datetime, timedelta
+import bisect
+import math
+import time
+from datetime import datetime
 
 import numpy as np
 import pyqtgraph as pg
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainterPath, QPen
+from PyQt6.QtWidgets import QGraphicsPathItem, QVBoxLayout, QWidget
 
 from tempus.desktop.theme import ThemeManager
 
 
+def _day_boundaries(start_ts: float, end_ts: float) -> np.ndarray:
+    """Get the local midnights within a time range.
+
+    Args:
+        start_ts: Start of the range as Unix timestamp
+        end_ts: End of the range as Unix timestamp
+
+    Returns:
+        Unix timestamps of all local midnights in [start_ts, end_ts]
+    """
+    # While the UTC offset stays constant every day is 86400 s long, so the
+    # boundaries form a regular grid. Round up to the next local midnight with
+    # plain epoch arithmetic, using the offset at the start of the range. The
+    # grid gets an extra day on each side, as offset changes can move a
+    # midnight across either end of the range.
+    offset = time.localtime(start_ts).tm_gmtoff
+    first_midnight = -(-(math.ceil(start_ts) + offset) // 86400) * 86400 - offset
+    day_count = max(int((end_ts - first_midnight) // 86400) + 1, 0)
+    grid = first_midnight + 86400.0 * np.arange(-1, day_count + 1)
+
+    # An offset change (DST or a historical rule change) moves the following
+    # midnights by the change, so shift each point by its own offset
+    offsets = np.array([time.localtime(ts).tm_gmtoff for ts in grid.tolist()], dtype=np.float64)
+    boundaries = grid - (offsets - offset)
+
+    # Points next to an offset change may miss midnight or hit the wrong one of
+    # two (e.g. when days start at 01:00, or clocks fall back to 00:00), and so
+    # may points shifted by a whole day. Offsets change at most once a day, so
+    # every other point lies in a stretch of constant offset and is exact.
+    # Let datetime resolve the few suspect days.
+    changed = np.diff(offsets) != 0
+    suspect = np.abs(offsets - offset) >= 86400
+    suspect[[0, -1]] = True
+    suspect[1:-1] |= changed[:-1] | changed[1:]
+    for index in np.flatnonzero(suspect).tolist():
+        year, month, day = time.gmtime(grid[index] + offset)[:3]
+        boundaries[index] = datetime(year, month, day).timestamp()
+
+    return boundaries[(boundaries >= start_ts) & (boundaries <= end_ts)]
+
+
+def _finite_bounds(data: np.ndarray) -> tuple[float, float]:
+    """Get the finite min/max of X or Y values.
+
+    Args:
+        data: X or Y values
+
+    Returns:
+        Tuple of (min, max), or (nan, nan) if there are no finite values
+    """
+    if len(data) == 0:
+        return (np.nan, np.nan)
+
+    # fmin/fmax skip NaN in a single pass without allocating a filtered copy;
+    # all-NaN data yields NaN bounds
+    bounds = (float(np.fmin.reduce(data)), float(np.fmax.reduce(data)))
+    if np.isinf(bounds).any():
+        # Rare: exclude +-inf so the axis range stays finite
+        finite_data = data[np.isfinite(data)]
+        if len(finite_data) == 0:
+            return (np.nan, np.nan)
+        bounds = (float(finite_data.min()), float(finite_data.max()))
+    return bounds
+
+
+def _as_float_array(data: np.ndarray, dtype: type[np.floating] = np.float64) -> np.ndarray:
+    """Get data as a contiguous float array, copying only if required.
+
+    pyqtgraph converts non-float or strided input on every setData call, so
+    coercing once up front avoids repeated conversions on updates.
+
+    Args:
+        data: Input values
+        dtype: Float type of the result
+
+    Returns:
+        Contiguous array of dtype (the input itself if it already qualifies)
+    """
+    return np.ascontiguousarray(data, dtype=dtype)
+
+
 class DateTimeAxis(pg.AxisItem):
     """Custom axis that displays Unix timestamps as formatted datetime strings."""
 
+    # Maximum number of formatted tick labels kept in the cache
+    FORMAT_CACHE_SIZE = 1024
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._datetime_format = "%Y-%m-%d %H:%M:%S"
+        # Tick values repeat while panning, so cache labels by (value, format)
+        self._fmt_cache: dict[tuple[float, str], str] = {}
 
     def tickStrings(self, values, scale, spacing):
         """Convert timestamp values to formatted datetime strings."""
+        # Adapt format based on spacing (zoom level)
+        if spacing > 86400:  # More than a day
+            fmt = "%Y-%m-%d"
+        elif spacing > 3600:  # More than an hour
+            fmt = "%m-%d %H:%M"
+        else:
+            fmt = "%H:%M:%S"
+
         strings = []
         for value in values:
-            try:
-                dt = datetime.fromtimestamp(value)
-                # Adapt format based on spacing (zoom level)
-                if spacing > 86400:  # More than a day
-                    fmt = "%Y-%m-%d"
-                elif spacing > 3600:  # More than an hour
-                    fmt = "%m-%d %H:%M"
-                elif spacing > 60:  # More than a minute
-                    fmt = "%H:%M:%S"
-                else:
-                    fmt = "%H:%M:%S"
-                strings.append(dt.strftime(fmt))
-            except (ValueError, OSError, OverflowError):
-                strings.append(str(value))
+            key = (value, fmt)
+            text = self._fmt_cache.get(key)
+            if text is None:
+                try:
+                    text = datetime.fromtimestamp(value).strftime(fmt)
+                except (ValueError, OSError, OverflowError):
+                    text = str(value)
+                if len(self._fmt_cache) >= self.FORMAT_CACHE_SIZE:
+                    self._fmt_cache.clear()
+                self._fmt_cache[key] = text
+            strings.append(text)
         return strings
 
 
@@ -47,6 +141,8 @@ class CrosshairManager:
         self.plot_item = plot_widget.getPlotItem()
         self._datetime_axis = datetime_axis
         self._parent_widget: TimeSeriesPlotWidget | None = None
+        # (name, x_data, y_data) of visible, non-empty series; rebuilt lazily
+        self._visible_series: list[tuple[str, np.ndarray, np.ndarray]] | None = None
 
         # Get theme colors
         theme_manager = ThemeManager.instance()
@@ -65,16 +161,46 @@ class CrosshairManager:
         self.label.setFont(QFont("Monospace", 9))
         self.plot_item.addItem(self.label, ignoreBounds=True)
 
-        # Connect mouse move
-        scene = plot_widget.scene()
-        assert scene is not None
-        self.proxy = pg.SignalProxy(scene.sigMouseMoved, rateLimit=60, slot=self._on_mouse_moved)  # type: ignore[attr-defined]
+        # Cache label anchor (top-right of view), refreshed only when the view changes
+        view_range = self.plot_item.viewRange()
+        self._label_anchor = (view_range[0][1], view_range[1][1])
+        self.plot_item.sigRangeChanged.connect(self._on_range_changed)
+
+        # While the view is panning only the lines follow the mouse; the label
+        # and closest-series lookup are refreshed once the view settles
+        self._is_panning = False
+        self._last_mouse_pos: tuple[float, float] | None = None
+        self._pan_timer = QTimer(plot_widget)
+        self._pan_timer.setSingleShot(True)
+        self._pan_timer.setInterval(150)  # 150ms without range changes ends a pan
+        self._pan_timer.timeout.connect(self._on_pan_finished)
+
+        # Track the mouse through view box hover events. The scene only delivers
+        # these while the cursor is over the view box (and already rate-limits
+        # mouse moves), so no per-event hit test against the plot is needed.
+        self.plot_item.vb.hoverEvent = self._on_hover
 
         self._visible = True
 
     def set_parent_widget(self, parent: "TimeSeriesPlotWidget") -> None:
         """Set reference to parent widget for accessing series data."""
         self._parent_widget = parent
+        self.invalidate_series()
+
+    def invalidate_series(self) -> None:
+        """Drop the cached visible series. Call when series data or visibility change."""
+        self._visible_series = None
+
+    def _get_visible_series(self) -> list[tuple[str, np.ndarray, np.ndarray]]:
+        """Get the visible, non-empty series, building the cache if needed."""
+        if self._visible_series is None:
+            self._visible_series = []
+            if self._parent_widget is not None:
+                curves = self._parent_widget._curves
+                for name, (x_data, y_data) in self._parent_widget._series_data.items():
+                    if name in curves and curves[name].isVisible() and len(x_data) > 0:
+                        self._visible_series.append((name, x_data, y_data))
+        return self._visible_series
 
     def update_theme(self) -> None:
         """Update crosshair colors for current theme."""
@@ -86,37 +212,57 @@ class CrosshairManager:
         self.h_line.setPen(pen)
         self.label.setColor(colors["crosshair_label"])
 
-    def _on_mouse_moved(self, evt) -> None:
-        """Update crosshair position on mouse move."""
-        pos = evt[0]
-        if self.plot_widget.sceneBoundingRect().contains(pos):
-            mouse_point = self.plot_item.vb.mapSceneToView(pos)
-            x, y = mouse_point.x(), mouse_point.y()
+    def _on_range_changed(self, view_box, ranges) -> None:
+        """Update the cached label anchor when the view range changes."""
+        self._label_anchor = (ranges[0][1], ranges[1][1])
+        self._is_panning = True
+        self._pan_timer.start()
+
+    def _on_pan_finished(self) -> None:
+        """Refresh the label once the view range has stopped changing."""
+        self._is_panning = False
+        if self._last_mouse_pos is not None:
+            self._update_label(*self._last_mouse_pos)
+
+    def _on_hover(self, evt) -> None:
+        """Update crosshair position while the mouse hovers over the view box."""
+        if evt.isExit():
+            return
 
-            self.v_line.setPos(x)
-            self.h_line.setPos(y)
+        # Hover positions are in view box coordinates, so map them to data coordinates
+        mouse_point = self.plot_item.vb.mapToView(evt.pos())
+        x, y = mouse_point.x(), mouse_point.y()
 
-            # Update label - show datetime if available
-            if self._datetime_axis is not None:
-                try:
-                    dt = datetime.fromtimestamp(x)
-                    x_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except (ValueError, OSError, OverflowError):
-                    x_str = f"{x:.2f}"
-            else:
-                x_str = f"{x:.2f}"
+        self.v_line.setPos(x)
+        self.h_line.setPos(y)
+        self._last_mouse_pos = (x, y)
 
-            # Find closest series
-            series_name = self._find_closest_series(x, y)
+        # Position label in top-right of view (to avoid legend)
+        self.label.setPos(*self._label_anchor)
 
-            label_text = f"x={x_str}, y={y:.2f}"
-            if series_name:
-                label_text += f" [{series_name}]"
-            self.label.setText(label_text)
+        if not self._is_panning:
+            self._update_label(x, y)
 
-            # Position label in top-right of view (to avoid legend)
-            view_range = self.plot_item.viewRange()
-            self.label.setPos(view_range[0][1], view_range[1][1])
+    def _update_label(self, x: float, y: float) -> None:
+        """Update the coordinate label for the given view position."""
+        # Show datetime if available
+        if self._datetime_axis is not None:
+            try:
+                dt = datetime.fromtimestamp(x)
+                x_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+            except (ValueError, OSError, OverflowError):
+                x_str = f"{x:.2f}"
+        else:
+            x_str = f"{x:.2f}"
+
+        # Find closest series
+        series_name = self._find_closest_series(x, y)
+
+        label_text = f"x={x_str}, y={y:.2f}"
+        if series_name:
+            label_text += f" [{series_name}]"
+        self.label.setText(label_text)
+        self.label.setPos(*self._label_anchor)
 
     def set_visible(self, visible: bool) -> None:
         """Show or hide the crosshair."""
@@ -130,10 +276,8 @@ class CrosshairManager:
         if self._parent_widget is None:
             return None
 
-        series_data = self._parent_widget._series_data
-        curves = self._parent_widget._curves
-
-        if not series_data:
+        visible_series = self._get_visible_series()
+        if not visible_series:
             return None
 
         closest_name = None
@@ -142,16 +286,15 @@ class CrosshairManager:
         y_range = self.plot_item.viewRange()[1]
         y_scale = y_range[1] - y_range[0] if y_range[1] != y_range[0] else 1
 
-        for name, (x_data, y_data) in series_data.items():
-            if name not in curves:
-                continue
-            if not curves[name].isVisible():
-                continue
-            if len(x_data) == 0:
-                continue
-
-            idx = np.searchsorted(x_data, x)
-            idx = max(0, min(idx, len(y_data) - 1))
+        last_x_data = None
+        idx = 0
+        for name, x_data, y_data in visible_series:
+            # Series usually share one time axis, so search each distinct axis once.
+            # bisect avoids NumPy's dispatch overhead for a single scalar lookup.
+            if x_data is not last_x_data:
+                idx = bisect.bisect_left(x_data, x)
+                idx = max(0, min(idx, len(x_data) - 1))
+                last_x_data = x_data
 
             dist = abs(y_data[idx] - y) / y_scale
             if dist < min_dist:
@@ -180,8 +323,28 @@ class TimeSeriesPlotWidget(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._curves: dict[str, pg.PlotDataItem] = {}
-        self._series_data: dict[str, tuple[np.ndarray, np.ndarray]] = {}  # Store x,y data for range calc
-        self._day_lines: list[pg.InfiniteLine] = []  # Day boundary lines
+        self._series_data: dict[str, tuple[np.ndarray, np.ndarray]] = {}  # Store x (float64), y (float32) data
+        # Per-series X/Y bounds kept in insertion order, so range updates reduce
+        # two values per series instead of rescanning the data
+        self._order: list[str] = []
+        self._x_min_arr = np.empty(0, dtype=np.float64)
+        self._x_max_arr = np.empty(0, dtype=np.float64)
+        self._y_min_arr = np.empty(0, dtype=np.float64)
+        self._y_max_arr = np.empty(0, dtype=np.float64)
+        # Day boundary lines, drawn as one path item instead of an item per line
+        self._day_lines: QGraphicsPathItem | None = None
+        self._day_boundary_ts = np.empty(0, dtype=np.float64)
+        self._last_emitted_range: tuple[float, float] | None = None  # Last range sent via range_changed
+        self._pending_range: tuple[float, float] | None = None  # Latest range awaiting emission
+        self._cached_pens: dict[tuple[str, float, Qt.PenStyle], QPen] = {}  # Pens reused across updates
+        self._last_axis_colors: tuple[str, str] | None = None  # (axis_pen, axis_text) last applied
+
+        # Coalesce the stream of range changes during a drag into one emission
+        self._range_timer = QTimer(self)
+        self._range_timer.setSingleShot(True)
+        self._range_timer.setInterval(50)  # 50ms debounce
+        self._range_timer.timeout.connect(self._emit_range)
+
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -192,6 +355,7 @@ class TimeSeriesPlotWidget(QWidget):
         # Get theme colors
         theme_manager = ThemeManager.instance()
         colors = theme_manager.get_plot_colors()
+        self._colors = colors  # Refreshed only when the theme changes
 
         # Configure pyqtgraph for current theme
         # Note: antialias=False is critical for performance with large datasets
@@ -222,6 +386,19 @@ class TimeSeriesPlotWidget(QWidget):
         # Configure axis appearance for current theme
         self._apply_axis_theme(colors)
 
+        # Downsampling and clip-to-view are applied by the plot item to every curve
+        # it adds (overriding per-curve options), so configure them here.
+        # "peak" keeps the min and max of every bin, so spikes survive at any zoom
+        # level, and clipping only sends in-view points to QPainter.
+        self._plot_item.setDownsampling(auto=True, mode="peak")
+        self._plot_item.setClipToView(True)
+        # Clipped curves only report the bounds of their in-view slice once X
+        # auto-range is off, so the view box menu's "View All" (autoRange())
+        # would keep the current zoom. Reset the view from the stored data instead.
+        view_all_action = self._plot_item.vb.menu.viewAll
+        view_all_action.triggered.disconnect()
+        view_all_action.triggered.connect(self.auto_range)
+
         # Enable mouse interaction (X-axis only for time-series zoom)
         self._plot_item.setMouseEnabled(x=True, y=False)
         # Disable Y auto-range - we'll manage it manually to include hidden series
@@ -231,8 +408,9 @@ class TimeSeriesPlotWidget(QWidget):
         self._crosshair = CrosshairManager(self._plot_widget, self._datetime_axis)
         self._crosshair.set_parent_widget(self)
 
-        # Connect range change signal
+        # Connect range change signals
         self._plot_item.sigRangeChanged.connect(self._on_range_changed)
+        self._plot_item.vb.sigYRangeChanged.connect(self._on_y_range_changed)
 
         # Store current title for theme updates
         self._current_title: str | None = None
@@ -242,16 +420,44 @@ class TimeSeriesPlotWidget(QWidget):
 
     def _apply_axis_theme(self, colors: dict) -> None:
         """Apply theme colors to axes."""
-        axis_pen = pg.mkPen(color=colors["axis_pen"], width=1)
+        # Setting axis pens discards the axes' cached pictures, so skip unchanged colors
+        axis_colors = (colors["axis_pen"], colors["axis_text"])
+        if axis_colors == self._last_axis_colors:
+            return
+        self._last_axis_colors = axis_colors
+
+        axis_pen = self._get_pen(colors["axis_pen"], 1)
+        text_pen = self._get_pen(colors["axis_text"], 1)
         for axis_name in ["bottom", "left", "top", "right"]:
             axis = self._plot_item.getAxis(axis_name)
             axis.setPen(axis_pen)
-            axis.setTextPen(pg.mkPen(color=colors["axis_text"]))
+            axis.setTextPen(text_pen)
+
+    def _get_pen(self, color: str, width: float, style: Qt.PenStyle = Qt.PenStyle.SolidLine) -> QPen:
+        """Return a cached pen for the given color, width and style.
+
+        Items copy the pen they are given, so a cached pen can be shared safely.
+
+        Args:
+            color: Line color (hex string)
+            width: Line width in pixels
+            style: Line style
+
+        Returns:
+            The cached QPen
+        """
+        key = (color, width, style)
+        pen = self._cached_pens.get(key)
+        if pen is None:
+            pen = pg.mkPen(color=color, width=width, style=style)
+            self._cached_pens[key] = pen
+        return pen
 
     def _on_theme_changed(self, theme) -> None:
         """Handle theme change."""
         theme_manager = ThemeManager.instance()
         colors = theme_manager.get_plot_colors()
+        self._colors = colors
 
         # Update plot background
         self._plot_widget.setBackground(colors["background"])
@@ -282,6 +488,10 @@ class TimeSeriesPlotWidget(QWidget):
     ) -> None:
         """Add or update a data series.
 
+        Y values are stored and drawn as float32, which halves memory traffic
+        when downsampling and drawing; its ~7 significant digits are ample for
+        display. X values stay float64, as float32 cannot resolve Unix timestamps.
+
         Args:
             name: Series identifier
             x_data: X values (time indices)
@@ -292,10 +502,12 @@ class TimeSeriesPlotWidget(QWidget):
         if isinstance(color, QColor):
             color = color.name()
 
-        pen = pg.mkPen(color=color, width=width)
+        pen = self._get_pen(color, width)
+        x_data = _as_float_array(x_data)
+        y_data = _as_float_array(y_data, np.float32)
 
         # Store data for range calculations (includes hidden series)
-        self._series_data[name] = (x_data, y_data)
+        self._store_series_data(name, x_data, y_data)
 
         if name in self._curves:
             # Update existing curve
@@ -303,20 +515,8 @@ class TimeSeriesPlotWidget(QWidget):
             curve.setData(x_data, y_data)
             curve.setPen(pen)
         else:
-            # Create new curve with auto-downsampling for performance
-            curve = self._plot_item.plot(
-                x_data,
-                y_data,
-                pen=pen,
-                name=name,
-                # Enable downsampling for large datasets
-                downsample=1,
-                autoDownsample=True,
-                downsampleMethod="subsample",
-                # Note: clipToView=True causes issues with PyQt6 due to
-                # autoRangeEnabled() not being accessible on PlotWidget
-                clipToView=False,
-            )
+            # Create new curve (downsampling and clipping are configured on the plot item)
+            curve = self._plot_item.plot(x_data, y_data, pen=pen, name=name)
             self._curves[name] = curve
 
     def update_series_data(self, name: str, x_data: np.ndarray, y_data: np.ndarray) -> None:
@@ -328,9 +528,55 @@ class TimeSeriesPlotWidget(QWidget):
             y_data: New Y values
         """
         if name in self._curves:
-            self._series_data[name] = (x_data, y_data)
+            x_data = _as_float_array(x_data)
+            y_data = _as_float_array(y_data, np.float32)
+            self._store_series_data(name, x_data, y_data)
             self._curves[name].setData(x_data, y_data)
 
+    def _store_series_data(self, name: str, x_data: np.ndarray, y_data: np.ndarray) -> None:
+        """Store series data and its X/Y bounds for range calculations.
+
+        Args:
+            name: Series identifier
+            x_data: X values
+            y_data: Y values
+        """
+        x_bounds = self._x_bounds(x_data, exclude=name)
+        y_bounds = _finite_bounds(y_data)
+
+        self._series_data[name] = (x_data, y_data)
+        self._crosshair.invalidate_series()
+
+        if name in self._order:
+            index = self._order.index(name)
+            self._x_min_arr[index], self._x_max_arr[index] = x_bounds
+            self._y_min_arr[index], self._y_max_arr[index] = y_bounds
+        else:
+            self._order.append(name)
+            self._x_min_arr = np.append(self._x_min_arr, x_bounds[0])
+            self._x_max_arr = np.append(self._x_max_arr, x_bounds[1])
+            self._y_min_arr = np.append(self._y_min_arr, y_bounds[0])
+            self._y_max_arr = np.append(self._y_max_arr, y_bounds[1])
+
+    def _x_bounds(self, x_data: np.ndarray, exclude: str | None = None) -> tuple[float, float]:
+        """Get the finite min/max of X values, reusing cached bounds if possible.
+
+        Series loaded from one file share a single time array, so its bounds
+        only need to be computed once.
+
+        Args:
+            x_data: X values
+            exclude: Series whose cached bounds must not be reused, e.g. the
+                series being replaced (its array may have been refilled in place)
+
+        Returns:
+            Tuple of (min, max), or (nan, nan) if there are no finite values
+        """
+        for index, name in enumerate(self._order):
+            if name != exclude and self._series_data[name][0] is x_data:
+                return (float(self._x_min_arr[index]), float(self._x_max_arr[index]))
+        return _finite_bounds(x_data)
+
     def set_series_visible(self, name: str, visible: bool) -> None:
         """Set visibility of a series.
 
@@ -340,6 +586,7 @@ class TimeSeriesPlotWidget(QWidget):
         """
         if name in self._curves:
             self._curves[name].setVisible(visible)
+            self._crosshair.invalidate_series()
 
     def set_series_color(self, name: str, color: QColor | str) -> None:
         """Set the color of a series.
@@ -354,7 +601,7 @@ class TimeSeriesPlotWidget(QWidget):
             curve = self._curves[name]
             pen = curve.opts["pen"]
             width: int = pen.width() if hasattr(pen, "width") and callable(pen.width) else 1  # type: ignore[union-attr]
-            curve.setPen(pg.mkPen(color=color, width=width))
+            curve.setPen(self._get_pen(color, width))
 
     def set_series_width(self, name: str, width: int) -> None:
         """Set the line width of a series.
@@ -367,7 +614,7 @@ class TimeSeriesPlotWidget(QWidget):
             curve = self._curves[name]
             pen = curve.opts["pen"]
             color: str = pen.color().name() if hasattr(pen, "color") and callable(pen.color) else "#1f77b4"  # type: ignore[union-attr]
-            curve.setPen(pg.mkPen(color=color, width=width))
+            curve.setPen(self._get_pen(color, width))
 
     def has_series(self, name: str) -> bool:
         """Check if a series exists in the plot.
@@ -389,7 +636,15 @@ class TimeSeriesPlotWidget(QWidget):
         if name in self._curves:
             curve = self._curves.pop(name)
             self._series_data.pop(name, None)
+            if name in self._order:
+                index = self._order.index(name)
+                del self._order[index]
+                self._x_min_arr = np.delete(self._x_min_arr, index)
+                self._x_max_arr = np.delete(self._x_max_arr, index)
+                self._y_min_arr = np.delete(self._y_min_arr, index)
+                self._y_max_arr = np.delete(self._y_max_arr, index)
             self._plot_item.removeItem(curve)
+            self._crosshair.invalidate_series()
 
     def clear_all(self) -> None:
         """Remove all series from the plot."""
@@ -397,6 +652,12 @@ class TimeSeriesPlotWidget(QWidget):
             self.remove_series(name)
         self._curves.clear()
         self._series_data.clear()
+        self._order.clear()
+        self._x_min_arr = np.empty(0, dtype=np.float64)
+        self._x_max_arr = np.empty(0, dtype=np.float64)
+        self._y_min_arr = np.empty(0, dtype=np.float64)
+        self._y_max_arr = np.empty(0, dtype=np.float64)
+        self._crosshair.invalidate_series()
         self.clear_day_boundaries()
 
     def add_day_boundaries(self, x_data: np.ndarray) -> None:
@@ -410,73 +671,74 @@ class TimeSeriesPlotWidget(QWidget):
         if len(x_data) == 0:
             return
 
-        theme_manager = ThemeManager.instance()
-        colors = theme_manager.get_plot_colors()
-        pen = pg.mkPen(color=colors["day_boundary"], width=1, style=Qt.PenStyle.DashLine)
-
-        # Find day boundaries
-        start_ts = float(x_data.min())
-        end_ts = float(x_data.max())
-
-        # Get midnight of the first day
-        start_dt = datetime.fromtimestamp(start_ts)
-        current_day = datetime(start_dt.year, start_dt.month, start_dt.day)
-
-        # Move to next day if we're not exactly at midnight
-        if current_day.timestamp() < start_ts:
-            current_day += timedelta(days=1)
-
-        # Add lines for each day boundary
-        while current_day.timestamp() <= end_ts:
-            line = pg.InfiniteLine(
-                pos=current_day.timestamp(),
-                angle=90,
-                movable=False,
-                pen=pen,
-            )
-            self._plot_item.addItem(line, ignoreBounds=True)
-            self._day_lines.append(line)
-
-            # Move to next day
-            current_day += timedelta(days=1)
+        # Find day boundaries (bounds are cached when x_data belongs to a series)
+        start_ts, end_ts = self._x_bounds(x_data)
+        if np.isnan(start_ts):
+            return
+
+        self._day_boundary_ts = _day_boundaries(start_ts, end_ts)
+        if len(self._day_boundary_ts) == 0:
+            return
+
+        # A single path item holds all lines, so the scene tracks one item
+        # instead of one InfiniteLine per day
+        self._day_lines = QGraphicsPathItem()
+        self._day_lines.setPen(self._get_pen(self._colors["day_boundary"], 1, Qt.PenStyle.DashLine))
+        self._plot_item.addItem(self._day_lines, ignoreBounds=True)
+        self._update_day_boundary_path()
+
+    def _update_day_boundary_path(self) -> None:
+        """Rebuild the day boundary path to span the current Y range."""
+        if self._day_lines is None:
+            return
+
+        # Lines end at the view edges: a dashed pen along a near-infinite path
+        # would be very expensive to stroke
+        y_min, y_max = self._plot_item.viewRange()[1]
+        path = QPainterPath()
+        for boundary_ts in self._day_boundary_ts.tolist():
+            path.moveTo(boundary_ts, y_min)
+            path.lineTo(boundary_ts, y_max)
+        self._day_lines.setPath(path)
+
+    def _on_y_range_changed(self, view_box, y_range) -> None:
+        """Keep the day boundary lines spanning the view when the Y range changes."""
+        self._update_day_boundary_path()
 
     def clear_day_boundaries(self) -> None:
         """Remove all day boundary lines."""
-        for line in self._day_lines:
-            self._plot_item.removeItem(line)
-        self._day_lines.clear()
+        if self._day_lines is not None:
+            self._plot_item.removeItem(self._day_lines)
+            self._day_lines = None
+        self._day_boundary_ts = np.empty(0, dtype=np.float64)
 
     def update_day_boundary_theme(self) -> None:
         """Update day boundary line colors for current theme."""
-        theme_manager = ThemeManager.instance()
-        colors = theme_manager.get_plot_colors()
-        pen = pg.mkPen(color=colors["day_boundary"], width=1, style=Qt.PenStyle.DashLine)
-        for line in self._day_lines:
-            line.setPen(pen)
+        if self._day_lines is not None:
+            self._day_lines.setPen(self._get_pen(self._colors["day_boundary"], 1, Qt.PenStyle.DashLine))
 
     def auto_range(self) -> None:
         """Reset view to show all data, including hidden series."""
         self._update_y_range()
-        # Auto-range X axis only
-        self._plot_item.enableAutoRange(axis="x")
-        self._plot_item.autoRange()
+        # Auto-range X axis only. Use the stored data rather than autoRange(),
+        # since clipped curves only report bounds of their in-view slice.
+        data_range = self.get_data_time_range()
+        if data_range is not None:
+            self._plot_item.setXRange(data_range[0], data_range[1])
 
     def _update_y_range(self) -> None:
         """Update Y axis range to include all series data (visible and hidden)."""
-        if not self._series_data:
+        if not self._order:
             return
 
-        y_min = float("inf")
-        y_max = float("-inf")
+        y_mins = self._y_min_arr
+        y_maxs = self._y_max_arr
 
-        for _name, (x_data, y_data) in self._series_data.items():
-            # Filter out NaN values
-            valid_data = y_data[~np.isnan(y_data)]
-            if len(valid_data) > 0:
-                y_min = min(y_min, float(np.nanmin(valid_data)))
-                y_max = max(y_max, float(np.nanmax(valid_data)))
-
-        if y_min != float("inf") and y_max != float("-inf"):
+        # Series without any valid values have NaN bounds
+        has_data = ~np.isnan(y_mins)
+        if has_data.any():
+            y_min = float(y_mins[has_data].min())
+            y_max = float(y_maxs[has_data].max())
             # Add 5% padding
             padding = (y_max - y_min) * 0.05
             if padding == 0:
@@ -490,21 +752,34 @@ class TimeSeriesPlotWidget(QWidget):
     def set_title(self, title: str) -> None:
         """Set the plot title."""
         self._current_title = title
-        theme_manager = ThemeManager.instance()
-        colors = theme_manager.get_plot_colors()
-        self._plot_item.setTitle(title, color=colors["title_color"], size="12pt")
+        self._plot_item.setTitle(title, color=self._colors["title_color"], size="12pt")
 
     def set_labels(self, x_label: str = "Time Index", y_label: str = "Value") -> None:
         """Set axis labels."""
-        theme_manager = ThemeManager.instance()
-        colors = theme_manager.get_plot_colors()
-        self._plot_item.setLabel("bottom", x_label, color=colors["label_color"])
-        self._plot_item.setLabel("left", y_label, color=colors["label_color"])
+        self._plot_item.setLabel("bottom", x_label, color=self._colors["label_color"])
+        self._plot_item.setLabel("left", y_label, color=self._colors["label_color"])
 
     def _on_range_changed(self, view_box, ranges) -> None:
-        """Handle view range change."""
-        x_range = ranges[0]
-        self.range_changed.emit(x_range[0], x_range[1])
+        """Handle view range change by scheduling a debounced emission."""
+        self._pending_range = (ranges[0][0], ranges[0][1])
+        self._range_timer.start()
+
+    def _emit_range(self) -> None:
+        """Emit the latest view range after the debounce delay."""
+        if self._pending_range is None:
+            return
+        x_min, x_max = self._pending_range
+        self._pending_range = None
+
+        # Skip emissions caused by sub-pixel jitter (e.g. on resize or theme change)
+        if self._last_emitted_range is not None:
+            last_min, last_max = self._last_emitted_range
+            tolerance = abs(x_max - x_min) * 1e-6
+            if abs(x_min - last_min) <= tolerance and abs(x_max - last_max) <= tolerance:
+                return
+
+        self._last_emitted_range = (x_min, x_max)
+        self.range_changed.emit(x_min, x_max)
 
     def set_time_range(self, start_ts: float, end_ts: float) -> None:
         """Set the visible X-axis range using Unix timestamps.
@@ -530,21 +805,12 @@ class TimeSeriesPlotWidget(QWidget):
         Returns:
             Tuple of (min_timestamp, max_timestamp) or None if no data
         """
-        if not self._series_data:
-            return None
-
-        x_min = float("inf")
-        x_max = float("-inf")
-
-        for _name, (x_data, _y_data) in self._series_data.items():
-            if len(x_data) > 0:
-                x_min = min(x_min, float(x_data.min()))
-                x_max = max(x_max, float(x_data.max()))
-
-        if x_min == float("inf") or x_max == float("-inf"):
+        # Series without any valid timestamps have NaN bounds
+        has_data = ~np.isnan(self._x_min_arr)
+        if not has_data.any():
             return None
 
-        return x_min, x_max
+        return float(self._x_min_arr[has_data].min()), float(self._x_max_arr[has_data].max())
 
     @property
     def plot_widget(self) -> pg.PlotWidget:
@@ -5,36 +5,101 @@ A high-performance desktop GUI for visualizing large time-series datasets.
 Uses PyQt6 and pyqtgraph for smooth interaction with millions of data points.
 
 Usage:
-    uv run python -m tempus.desktop_app [csv_file]
+    uv run python -m tempus.desktop_app [--ui-scale FACTOR] [--opengl] [csv_file]
 
     Or with the script:
-    uv run tempus-desktop [csv_file]
+    uv run tempus-desktop [--ui-scale FACTOR] [--opengl] [csv_file]
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
 
-# Apply UI scale factor BEFORE importing QApplication
-os.environ["QT_SCALE_FACTOR"] = "1.5"
-
+import pyqtgraph as pg
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
 
 from tempus.desktop.theme import ThemeManager
 
 
+def _add_options(parser: argparse.ArgumentParser) -> None:
+    """Add the options that must be known before the QApplication is created.
+
+    Args:
+        parser: Parser to add the options to
+    """
+    parser.add_argument(
+        "--ui-scale",
+        type=float,
+        default=None,
+        help="Scale the whole UI by this factor (e.g. 1.5). Fractional factors slow down plot rendering.",
+    )
+    parser.add_argument(
+        "--opengl",
+        action="store_true",
+        help="Draw plots with OpenGL (experimental; line widths above 1 px may not be honoured).",
+    )
+
+
+def parse_startup_options(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    """Parse the options needed before the QApplication is created.
+
+    Qt's own options (e.g. -style fusion) are still in argv at this point, so
+    the CSV file is left for parse_args once Qt has removed them.
+
+    Args:
+        argv: Command line arguments, including the program name
+
+    Returns:
+        Tuple of (parsed options, remaining arguments to pass to QApplication)
+    """
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    _add_options(parser)
+    options, rest = parser.parse_known_args(argv[1:])
+    return options, [argv[0], *rest]
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the command line arguments left after Qt removed its own options.
+
+    Args:
+        argv: Command line arguments, including the program name
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Tempus time-series viewer")
+    parser.add_argument("csv_file", nargs="?", help="CSV file to open on startup")
+    _add_options(parser)
+    return parser.parse_args(argv[1:])
+
+
 def main() -> int:
     """Main entry point for the application."""
-    # Enable high DPI scaling
-    QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    options, qt_args = parse_startup_options(sys.argv)
 
-    # Create application
-    app = QApplication(sys.argv)
+    # Global scaling is opt-in: fractional factors make pyqtgraph rendering
+    # several times slower, far more than the added pixel count suggests
+    if options.ui_scale is not None:
+        os.environ["QT_SCALE_FACTOR"] = str(options.ui_scale)
+
+    # OpenGL is opt-in: pyqtgraph's GL viewport is experimental, and core
+    # profile contexts ignore line widths above 1 px
+    if options.opengl:
+        pg.setConfigOption("useOpenGL", True)
+
+    # Round high DPI scale factors to integers to keep rendering fast
+    QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.Round)
+
+    # Create application; Qt removes the options it handles (e.g. -style)
+    app = QApplication(qt_args)
     app.setApplicationName("Tempus")
     app.setOrganizationName("Tempus")
     app.setApplicationVersion("0.1.0")
 
+    args = parse_args(app.arguments())
+
     # Apply initial theme (light mode by default)
     theme_manager = ThemeManager.instance()
     theme_manager.apply_initial_theme()
@@ -47,8 +112,8 @@ def main() -> int:
     window.show()
 
     # Load file from command line if provided
-    if len(sys.argv) > 1:
-        filepath = Path(sys.argv[1])
+    if args.csv_file:
+        filepath = Path(args.csv_file)
         if filepath.exists():
             window.load_file_on_startup(str(filepath))
 
@@ -2,11 +2,37 @@
 
 import json
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Settings keys are relative to the home directory, which is looked up once
+_HOME = Path.home()
+
+
+@lru_cache(maxsize=1024)
+def _compute_relative_key(filepath: str) -> str:
+    """Get the file key relative to the user's home directory.
+
+    Cached because resolve() hits the filesystem and the same files are
+    looked up repeatedly (e.g. once per layer when a file is loaded).
+
+    Args:
+        filepath: Absolute path to the CSV file
+
+    Returns:
+        Path string relative to home directory, or absolute path if not under home.
+    """
+    abs_path = Path(filepath).resolve()
+    try:
+        return str(abs_path.relative_to(_HOME))
+    except ValueError:
+        # File is not under home directory, use absolute path
+        return str(abs_path)
+
 
 class ConfigManager:
     """Manages persistent configuration for layer settings per CSV file.
@@ -49,6 +75,8 @@ class ConfigManager:
         # Store config in the project directory (where this module is located)
         self._config_path = Path(__file__).parent.parent.parent.parent / self.CONFIG_FILENAME
         self._config: dict[str, Any] = {}
+        # Set while the in-memory config differs from the settings file
+        self._dirty = False
         self._load_config()
 
     @classmethod
@@ -71,13 +99,24 @@ class ConfigManager:
             self._config = {}
 
     def _save_config(self) -> None:
-        """Save configuration to the settings file."""
+        """Save configuration to the settings file.
+
+        Writes to a temporary file that replaces the settings file once it is
+        complete, so a crash mid-write never leaves a truncated file behind.
+        """
+        tmp_path = self._config_path.with_name(self._config_path.name + ".tmp")
         try:
-            with open(self._config_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(self._config, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._config_path)
+            self._dirty = False
             logger.debug("Saved config to %s", self._config_path)
         except OSError as e:
             logger.warning("Failed to save config file: %s", e)
+            tmp_path.unlink(missing_ok=True)
+            self._dirty = True
 
     def _get_relative_key(self, filepath: str | Path) -> str:
         """Get the file key relative to the user's home directory.
@@ -88,13 +127,9 @@ class ConfigManager:
         Returns:
             Path string relative to home directory, or absolute path if not under home.
         """
-        abs_path = Path(filepath).resolve()
-        home = Path.home()
-        try:
-            return str(abs_path.relative_to(home))
-        except ValueError:
-            # File is not under home directory, use absolute path
-            return str(abs_path)
+        # abspath() is cheap and keeps cached keys of relative paths valid if the
+        # working directory changes
+        return _compute_relative_key(os.path.abspath(filepath))
 
     def get_file_config(self, filepath: str | Path) -> dict[str, Any] | None:
         """Get the stored configuration for a specific file.
@@ -118,6 +153,11 @@ class ConfigManager:
                         'layers' should contain layer configurations keyed by column name.
         """
         rel_path = self._get_relative_key(filepath)
+        # Layer edits often re-save an unchanged configuration (e.g. right after
+        # it was applied on load), so skip rewriting the whole file in that case,
+        # unless the last write failed and the file is behind
+        if not self._dirty and self._config.get(rel_path) == config_dict:
+            return
         self._config[rel_path] = config_dict
         self._save_config()
 
@@ -182,10 +222,11 @@ class ConfigManager:
             try:
                 self._config_path.unlink()
                 logger.info("Deleted config file: %s", self._config_path)
-                return True
             except OSError as e:
                 logger.error("Failed to delete config file: %s", e)
+                self._dirty = True
                 return False
+        self._dirty = False
         return True
 
     @property